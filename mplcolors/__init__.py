@@ -0,0 +1,10 @@
+"""
+mplcolors: print and manipulate matplotlib colors in the terminal.
+
+Everything lives in the single canonical module mplcolors.mplcolors;
+re-export it here so package users get the same implementation the CLI
+script runs.
+"""
+
+from .mplcolors import *  # noqa: F401,F403
+from .mplcolors import __version__  # noqa: F401
@@ -20,36 +20,155 @@ for getting color names and values.
 Also usable as a package.
 """
 
-import math
 import argparse
-from collections import OrderedDict
+import bisect
+import functools
+import importlib.metadata
 import os
+import sys
 import difflib
 
-# import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
-import matplotlib as mpl
-from matplotlib import cm
-
-__version__ = "1.1.1"
+# Optional: C-accelerated fuzzy matching for color name suggestions.
+try:
+  from rapidfuzz import fuzz as _rf_fuzz
+  from rapidfuzz import process as _rf_process
+except ImportError:
+  _rf_fuzz = None
+  _rf_process = None
+
+# Optional: JIT-compile the scalar HSV converters for bulk harmonic
+# generation. Pure-Python fallback when numba is absent.
+try:
+  from numba import njit as _njit
+except ImportError:
+  _njit = None
+
+# single source of truth is the installed package metadata; fall back
+# to the last release for source checkouts / standalone script runs.
+try:
+  __version__ = importlib.metadata.version("mplcolors")
+except importlib.metadata.PackageNotFoundError:
+  __version__ = "1.1.1"
 
 _COL_LENGTH_ = 32  # max column length for printing colors.
 
+# matplotlib (and numpy with it) dominate CLI start-up, so both are
+# imported lazily via _import_mpl the first time a code path needs
+# them; `mplcolors -v` never pays the cost.
+np = None
+mcolors = None
+mpl = None
+cm = None
+_to_rgb = None
+
+
+def _import_mpl():
+  """
+  Import matplotlib and numpy on first use and bind the module-level
+  names the rest of the file expects. Safe to call repeatedly.
+  """
+  global np, mcolors, mpl, cm, _to_rgb
+  if mpl is not None:
+    return
+  import numpy
+  import matplotlib
+  import matplotlib.colors
+  import matplotlib.cm
+
+  np = numpy
+  mpl = matplotlib
+  mcolors = matplotlib.colors
+  cm = matplotlib.cm
+
+  # Cached color name -> rgb conversion. Search, complement, and the
+  # sorted print path all resolve the same names repeatedly.
+  _to_rgb = functools.lru_cache(maxsize=2048)(mcolors.to_rgb)
+
+
+# End _import_mpl
+
+_TERM = None  # memoized terminal size, see _get_term
+
+
+def _get_term():
+  """
+  Terminal size, queried once per process. The size is stable for the
+  life of a CLI run, so there is no need to repeat the ioctl for every
+  row or colorbar.
+  """
+  global _TERM
+  if _TERM is None:
+    _TERM = os.get_terminal_size()
+  return _TERM
+
+
+# End _get_term
+
 # === Helper Functions ===
 
 
-def ColorAbs(val):
+def _rgb_to_hsv_scalar(r, g, b):
   """
-  an "absolute value" on the color wheel for H values.
-  e.g., for negative numbers, return 360 - H
+  RGB -> HSV for a single color on plain floats. The harmonic helpers
+  only ever convert one color at a time, so this skips the array
+  round-trip through matplotlib.
+  returns: tuple(h,s,v)
   """
+  mx = max(r, g, b)
+  delta = mx - min(r, g, b)
+
+  s = 0.0 if mx == 0.0 else delta / mx
+  if delta == 0.0:
+    h = 0.0
+  elif mx == r:
+    h = (g - b) / delta
+  elif mx == g:
+    h = 2.0 + (b - r) / delta
+  else:
+    h = 4.0 + (r - g) / delta
 
-  return val if (val >= 0.0) else 1.0 + val
+  return ((h / 6.0) % 1.0, s, mx)
 
 
-# End ColorAbs
+# End _rgb_to_hsv_scalar
 
 
+def _hsv_to_rgb_scalar(h, s, v):
+  """
+  HSV -> RGB for a single color on plain floats; the usual sextant
+  decomposition, matching mcolors.hsv_to_rgb.
+  returns: tuple(r,g,b)
+  """
+  i = int(h * 6.0)
+  f = h * 6.0 - i
+  p = v * (1.0 - s)
+  q = v * (1.0 - s * f)
+  t = v * (1.0 - s * (1.0 - f))
+  i %= 6
+
+  if i == 0:
+    return (v, t, p)
+  if i == 1:
+    return (q, v, p)
+  if i == 2:
+    return (p, v, t)
+  if i == 3:
+    return (p, q, v)
+  if i == 4:
+    return (t, p, v)
+  return (v, p, q)
+
+
+# End _hsv_to_rgb_scalar
+
+if _njit is not None:
+  # nopython-compiled variants; cache=True keeps the compilation cost
+  # to the first ever run.
+  _rgb_to_hsv_scalar = _njit(cache=True)(_rgb_to_hsv_scalar)
+  _hsv_to_rgb_scalar = _njit(cache=True)(_hsv_to_rgb_scalar)
+
+
+@functools.lru_cache(maxsize=1024)
 def NameToRGB(name):
   """
   General purpose conversion to RGB
@@ -58,13 +177,14 @@ def NameToRGB(name):
   Returns:
     rgb: tuple
   """
-  if name[0].isnumeric():  # no # in string
-    name = "#" + name
-    rgb = HexToRGB(name)
-  elif name[0] == "#":  # yes # in string
+  _import_mpl()
+  c = name[0]
+  if c == "#":  # yes # in string
     rgb = HexToRGB(name)
+  elif "0" <= c <= "9":  # no # in string; plain compare, no Unicode
+    rgb = HexToRGB("#" + name)  # category lookup like isnumeric()
   else:  # input is mpl color name
-    rgb = mcolors.to_rgb(name)
+    rgb = _to_rgb(name)
   return rgb
 
 
@@ -95,9 +215,7 @@ def hilo(a, b, c):
   min + max of (a, b, c). used for complement.
   """
 
-  minval = min(min(a, b), c)
-  maxval = max(max(a, b), c)
-  return minval + maxval
+  return min(a, b, c) + max(a, b, c)
 
 
 # End hili
@@ -114,42 +232,41 @@ def Complement(r, g, b):
   returns: tuple(r,g,b)
   """
   k = hilo(r, g, b)
-  return tuple(k - u for u in (r, g, b))
+  return (k - r, k - g, k - b)
 
 
 # End Complement
 
 
-def GetTriad(name):
+def _get_harmonic(name, offsets):
   """
-  Compute color triad. Convert to HSV and manipulate "H" (the zero component)
-  Parameters:
-    name - string. Either mpl color or hex.
-  Returns:
-    triad: list(tuples(hexvalues))
+  Hex values for "name" plus its hue rotated by each offset (degrees).
+  Shared kernel for the triad/tetrad/split-complement helpers: one
+  RGB -> HSV conversion, one rotation per offset.
   """
   rgb_in = NameToRGB(name)
+  hsv_in = _rgb_to_hsv_scalar(*rgb_in)
 
-  out = []
+  out = [RGBToHex(rgb_in)]
+  for offset in offsets:
+    h = (hsv_in[0] + offset / 360.0) % 1.0  # float % 1.0 wraps the hue
+    out.append(RGBToHex(_hsv_to_rgb_scalar(h, hsv_in[1], hsv_in[2])))
 
-  # convert to hsv
-  hsv_in = RGBToHSV(rgb_in)
-  hsv_2 = hsv_in.copy()  # will modify later
-  hsv_3 = hsv_in.copy()
+  return out
 
-  # manipulate to get triad
-  h_2 = ColorAbs(hsv_in[0] + (120.0 / 360.0) - 1.0)
-  h_3 = ColorAbs(hsv_in[0] + (240.0 / 360.0) - 1.0)
 
-  hsv_2[0] = h_2
-  hsv_3[0] = h_3
+# End _get_harmonic
 
-  # convert all to hex
-  out.append(RGBToHex(rgb_in))
-  out.append(HSVToHex(hsv_2))
-  out.append(HSVToHex(hsv_3))
 
-  return out
+def GetTriad(name):
+  """
+  Compute color triad. Convert to HSV and manipulate "H" (the zero component)
+  Parameters:
+    name - string. Either mpl color or hex.
+  Returns:
+    triad: list(tuples(hexvalues))
+  """
+  return _get_harmonic(name, (120.0, 240.0))
 
 
 # End GetTriad
@@ -163,28 +280,7 @@ def GetSplitComplement(name):
   Returns:
     triad: list(tuples(hexvalues))
   """
-  rgb_in = NameToRGB(name)
-
-  out = []
-
-  # convert to hsv
-  hsv_in = RGBToHSV(rgb_in)
-  hsv_2 = hsv_in.copy()  # will modify later
-  hsv_3 = hsv_in.copy()
-
-  # manipulate to get triad
-  h_2 = ColorAbs(hsv_in[0] + (150.0 / 360.0) - 1.0)
-  h_3 = ColorAbs(hsv_in[0] + (210.0 / 360.0) - 1.0)
-
-  hsv_2[0] = h_2
-  hsv_3[0] = h_3
-
-  # convert all to hex
-  out.append(RGBToHex(rgb_in))
-  out.append(HSVToHex(hsv_2))
-  out.append(HSVToHex(hsv_3))
-
-  return out
+  return _get_harmonic(name, (150.0, 210.0))
 
 
 # End GetSplitComplement
@@ -198,37 +294,32 @@ def GetTetrad(name):
   Returns:
     triad: list(tuples(hexvalues))
   """
-  rgb_in = NameToRGB(name)
+  return _get_harmonic(name, (90.0, 180.0, 270.0))
 
-  out = []
 
-  # convert to hsv
-  hsv_in = RGBToHSV(rgb_in)
-  hsv_2 = hsv_in.copy()  # will modify later
-  hsv_3 = hsv_in.copy()
-  hsv_4 = hsv_in.copy()
+# End GetTetrad
 
-  # manipulate to get tetrad
-  h_2 = ColorAbs(hsv_in[0] + (90.0 / 360) - 1.0)
-  h_3 = ColorAbs(hsv_in[0] + (180.0 / 360) - 1.0)
-  h_4 = ColorAbs(hsv_in[0] + (270.0 / 360) - 1.0)
+# === Color Print Routines ===
 
-  hsv_2[0] = h_2
-  hsv_3[0] = h_3
-  hsv_4[0] = h_4
 
-  # convert all to hex
-  out.append(RGBToHex(rgb_in))
-  out.append(HSVToHex(hsv_2))
-  out.append(HSVToHex(hsv_3))
-  out.append(HSVToHex(hsv_4))
+# Padding strings up to a full column, so cell formatting never has to
+# allocate a fresh run of spaces.
+_PAD = [" " * i for i in range(_COL_LENGTH_ + 1)]
 
-  return out
 
+@functools.lru_cache(maxsize=4096)
+def _fmt_rgb_int(r, g, b):
+  """
+  Build the ANSI escape sequence for an integer (r, g, b) triple.
+  Cached: print loops hit the same few hundred colors over and over,
+  so repeated triples cost a single dict lookup.
+  """
 
-# End GetTetrad
+  # ANSI escape sequence mess
+  return f"\x1b[48;2;{r};{g};{b}m"
 
-# === Color Print Routines ===
+
+# End _fmt_rgb_int
 
 
 def FormatRGB(rgb):
@@ -238,29 +329,41 @@ def FormatRGB(rgb):
   Output is a string with ANSI escape sequences.
   """
 
-  rgb = [round(i * 255) for i in rgb]
-
-  # ANSI escape sequence mess
-  outstr = (
-    "\x1b[48;2;" + str(rgb[0]) + ";" + str(rgb[1]) + ";" + str(rgb[2]) + "m"
+  # int(x + 0.5) rather than round(): inputs are nonnegative, and this
+  # skips round()'s banker's-rounding dispatch.
+  r, g, b = rgb
+  return _fmt_rgb_int(
+    int(r * 255 + 0.5), int(g * 255 + 0.5), int(b * 255 + 0.5)
   )
-  return outstr
 
 
 # End FormatRGB
 
 
+def _fmt_cell(rgb, name):
+  """
+  Build the full swatch + label cell for a single color (rgb, name).
+  Returns the string rather than printing so callers can batch rows
+  into a single write.
+  """
+
+  # Set the length of an entry as 25 spaces
+  num_spaces = max(0, _COL_LENGTH_ - 5 - len(name))
+  return (
+    FormatRGB(rgb) + "      " + "\x1b[0;0m " + name + " " + _PAD[num_spaces]
+  )
+
+
+# End _fmt_cell
+
+
 def PrintColor(rgb, name, endline):
   """
   Print output for a single color (rbg, name).
   endline is a control to send a newline character
   """
 
-  # Set the length of an entry as 25 spaces
-  num_spaces = _COL_LENGTH_ - 5 - len(name)
-  print(
-    FormatRGB(rgb) + "      " + "\x1b[0;0m", name, num_spaces * " ", end=endline
-  )
+  print(_fmt_cell(rgb, name), end=endline)
 
 
 # End PrintColor
@@ -288,24 +391,30 @@ def PrintComplement(name):
 # End PrintComplement
 
 
+def _print_harmonic(name, label, offsets):
+  """
+  Shared printer for the harmonic modes: banner, then the base color
+  and each hue rotation as swatch rows.
+  """
+  message = "Finding RGB " + label + " of " + name
+  print(GetDecoString(message))
+
+  hexes = _get_harmonic(name, offsets)
+  PrintColor(HexToRGB(hexes[0]), name, "\n")
+  for hexval in hexes[1:]:
+    PrintColor(HexToRGB(hexval), str(hexval), "\n")
+
+
+# End _print_harmonic
+
+
 def PrintTriad(name):
   """
   Print color triad
   Parameters:
     name - string. Either mpl color or hex.
   """
-  message = "Finding RGB Triad of " + name
-  print(GetDecoString(message))
-
-  triad = GetTriad(name)
-  rgb_triad = []
-  for i in range(3):
-    rgb_triad.append(HexToRGB(triad[i]))
-
-  PrintColor(rgb_triad[0], name, "\n")
-  for i in range(1, 3):
-    name = str(triad[i])
-    PrintColor(rgb_triad[i], name, "\n")
+  _print_harmonic(name, "Triad", (120.0, 240.0))
 
 
 # End PrintTriad
@@ -317,18 +426,7 @@ def PrintSplitComplement(name):
   Parameters:
     name - string. Either mpl color or hex.
   """
-  message = "Finding RGB Split Complements of " + name
-  print(GetDecoString(message))
-
-  split_c = GetSplitComplement(name)
-  rgb_sc = []
-  for i in range(3):
-    rgb_sc.append(HexToRGB(split_c[i]))
-
-  PrintColor(rgb_sc[0], name, "\n")
-  for i in range(1, 3):
-    name = str(split_c[i])
-    PrintColor(rgb_sc[i], name, "\n")
+  _print_harmonic(name, "Split Complements", (150.0, 210.0))
 
 
 # End PrintSplitComplement
@@ -340,59 +438,106 @@ def PrintTetrad(name):
   Parameters:
     name - string. Either mpl color or hex.
   """
-  message = "Finding RGB Tetrad of " + name
-  print(GetDecoString(message))
+  _print_harmonic(name, "Tetrad", (90.0, 180.0, 270.0))
 
-  tetrad = GetTetrad(name)
-  rgb_tetrad = []
-  for i in range(4):
-    rgb_tetrad.append(HexToRGB(tetrad[i]))
 
-  PrintColor(rgb_tetrad[0], name, "\n")
-  for i in range(1, 4):
-    name = str(tetrad[i])
-    PrintColor(rgb_tetrad[i], name, "\n")
+# End PrintTetrad
 
 
-# End PrintTetrad
+def _rgb_to_hsv_batch(rgb):
+  """
+  RGB -> HSV over an (N, 3) array with plain max/min arithmetic.
+  Matches mcolors.rgb_to_hsv but skips matplotlib's input massaging;
+  used for the sort key below.
+  """
+  mx = rgb.max(axis=1)
+  delta = mx - rgb.min(axis=1)
+
+  hsv = np.zeros_like(rgb)
+  hsv[:, 2] = mx
+
+  pos = mx > 0
+  hsv[pos, 1] = delta[pos] / mx[pos]
+
+  pos = delta > 0
+  # hue from whichever channel holds the max; ties give equal hues
+  idx = (rgb[:, 0] == mx) & pos
+  hsv[idx, 0] = (rgb[idx, 1] - rgb[idx, 2]) / delta[idx]
+  idx = (rgb[:, 1] == mx) & pos
+  hsv[idx, 0] = 2.0 + (rgb[idx, 2] - rgb[idx, 0]) / delta[idx]
+  idx = (rgb[:, 2] == mx) & pos
+  hsv[idx, 0] = 4.0 + (rgb[idx, 0] - rgb[idx, 1]) / delta[idx]
+  hsv[:, 0] = (hsv[:, 0] / 6.0) % 1.0
+
+  return hsv
+
+
+# End _rgb_to_hsv_batch
+
+
+# Sorted palettes for the static matplotlib color tables, built on
+# first use. Keyed on dict identity: CSS4/XKCD never change, so the
+# sort + conversion runs once per process however often they print.
+_SORTED_CACHE = {}
 
 
 def GetSortedHsvColors(colors):
-  """return sorted colors by hsv. check mpl documentation for more."""
-  return sorted(
-    (tuple(mcolors.rgb_to_hsv(mcolors.to_rgb(color))), name)
-    for name, color in colors.items()
-  )
+  """
+  return sorted colors by hsv. check mpl documentation for more.
+  Entries are (hsv, name, rgb) so callers don't re-convert names.
+  """
+  _import_mpl()
+  cacheable = colors is mcolors.CSS4_COLORS or colors is _XKCD_FILTERED
+  if cacheable and id(colors) in _SORTED_CACHE:
+    return _SORTED_CACHE[id(colors)]
+
+  names = list(colors.keys())
+  rgb = np.array([_to_rgb(colors[name]) for name in names])
+  hsv = _rgb_to_hsv_batch(rgb)
+
+  # sort by (h, s, v); lexsort keys go least-significant first and the
+  # sort is stable, so equal colors keep the palette's name order.
+  order = np.lexsort((hsv[:, 2], hsv[:, 1], hsv[:, 0]))
+  by_hsv = [(tuple(hsv[i]), names[i], tuple(rgb[i])) for i in order]
+
+  if cacheable:
+    _SORTED_CACHE[id(colors)] = by_hsv
+  return by_hsv
 
 
 # End GetSortedHsvColors
 
 
-def PrintColors(colors=mcolors.CSS4_COLORS):
+def PrintColors(colors=None):
   """
   Print the standard matplotlib colors to screen.
   """
 
+  _import_mpl()
+  if colors is None:
+    colors = mcolors.CSS4_COLORS
+
   by_hsv = GetSortedHsvColors(colors)
-  names = [name for hsv, name in by_hsv]
 
   # NOTE: You may edit the number of printed columns here
 
   # do some "smart" setting of number of printed columns.
   # below _COL_LENGTH_ is a magic number I determined to be the max length of a col
-  cols = os.get_terminal_size().columns
-  # rows = os.get_terminal_size().lines
-  ncols = math.floor(cols / _COL_LENGTH_) - 1
+  cols = _get_term().columns
+  # rows = _get_term().lines
+  ncols = cols // _COL_LENGTH_ - 1
 
-  for i, name in enumerate(names):
+  # build the whole table in memory and emit it with a single write.
+  out = []
+  for i, (hsv, name, rgb) in enumerate(by_hsv):
     col = i % ncols
 
-    # print color.
-    # If we're at the end of a row, send in a newline.
+    out.append(_fmt_cell(rgb, name))
+    # If we're at the end of a row, end the line.
     if col == ncols - 1:
-      PrintColor(mcolors.to_rgb(name), name, "\n")
-    else:
-      PrintColor(mcolors.to_rgb(name), name, "")
+      out.append("\n")
+  sys.stdout.write("".join(out))
+  sys.stdout.flush()
 
 
 # End PrintColors
@@ -400,6 +545,7 @@ def PrintColors(colors=mcolors.CSS4_COLORS):
 # === Colorbar Routines ===
 
 
+@functools.lru_cache(maxsize=128)
 def GetColormap(name):
   """
   Load a colormap into a useable object.
@@ -407,8 +553,12 @@ def GetColormap(name):
 
   Create a scalar_map object that can return rgb values with
   scalar_map.to_rgba(0...255)
+
+  Cached per name: we only read from the mappable, so callers looping
+  over the same colormap reuse one Normalize + ScalarMappable pair.
   """
 
+  _import_mpl()
   norm = mpl.colors.Normalize(vmin=0.0, vmax=256)
   scalar_map = cm.ScalarMappable(norm=norm, cmap=name)
 
@@ -418,6 +568,43 @@ def GetColormap(name):
 # End GetColormap
 
 
+@functools.lru_cache(maxsize=128)
+def _colormap_lut(name, step):
+  """
+  Sampled integer-RGB lookup table for a named colormap: the cmap is
+  evaluated once over the strided 0..255 range, skipping the
+  Normalize/ScalarMappable layer entirely.
+  Returns a list of (r, g, b) ints ready for _fmt_rgb_int.
+  """
+
+  _import_mpl()
+  rgba = mpl.colormaps[name](np.arange(0, 256, step) / 256.0)
+  return [
+    (int(r * 255 + 0.5), int(g * 255 + 0.5), int(b * 255 + 0.5))
+    for r, g, b, a in rgba
+  ]
+
+
+# End _colormap_lut
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_rgb_bytes(r, g, b):
+  """
+  bytes twin of _fmt_rgb_int, for the buffered colorbar writer.
+  bytes %-formatting runs in C.
+  """
+  return b"\x1b[48;2;%d;%d;%dm" % (r, g, b)
+
+
+# End _fmt_rgb_bytes
+
+
+# width thresholds -> colorbar stride; wider terminals sample finer
+_STEP_THRESH = (55, 69, 91, 136)
+_STEPS = (8, 5, 4, 3, 2)
+
+
 def GetStep(cols):
   """
   Given the size of the terminal window,
@@ -425,17 +612,7 @@ def GetStep(cols):
   Hacky.
   """
 
-  step = 8
-  if cols > 55:
-    step = 5
-  if cols > 69:
-    step = 4
-  if cols > 91:
-    step = 3
-  if cols > 136:
-    step = 2
-
-  return step
+  return _STEPS[bisect.bisect_left(_STEP_THRESH, cols)]
 
 
 # End GetStep
@@ -446,21 +623,34 @@ def PrintColorbar(name):
   Print a single colorbar
   """
 
-  scalar_map = GetColormap(name)
+  _import_mpl()
 
   n = 17  # length for text
-  print((n - len(name)) * " " + name, end=" ")
 
   # get the length of the terminal window.
   # used for adjusting amount of colors printed
-  cols = os.get_terminal_size().columns
+  cols = _get_term().columns
 
   step = GetStep(cols)
 
   # Print every nth color. The colorbar is massive if we print all 256
-  for i in range(0, 256, step):
-    print(FormatRGB(scalar_map.to_rgba(i)[:-1]) + " " + "\033[0;0m", end="")
-  print("\n")
+  # The LUT holds the strided samples as ints, and the row goes out as
+  # one bytes write straight to the underlying binary stream, skipping
+  # the text-layer encoder. Adjacent samples often round to the same
+  # RGB (flat stretches of a cmap), so only switch the background
+  # color when it changes and reset once at the end of the row.
+  parts = [b" " * (n - len(name)), name.encode("ascii"), b" "]
+  prev = None
+  for rgb in _colormap_lut(name, step):
+    if rgb != prev:
+      parts.append(_fmt_rgb_bytes(*rgb))
+      prev = rgb
+    parts.append(b" ")
+  parts.append(b"\033[0;0m\n\n")
+
+  # flush the text layer first so direct buffer writes stay ordered
+  sys.stdout.flush()
+  sys.stdout.buffer.write(b"".join(parts))
 
 
 # End PrintColorbar
@@ -471,15 +661,14 @@ def PrintColorbars(cmaps):
   Print a set of colorbars from dictionary cmap
   """
 
-  for cmap_category, cmap_list in cmaps.items():
-    cols = os.get_terminal_size().columns
-    size = int((256 + 17) / GetStep(cols) - 1)
+  # terminal geometry doesn't change between categories; compute once
+  cols = _get_term().columns
+  size = int((256 + 17) / GetStep(cols) - 1)
 
+  for cmap_category, cmap_list in cmaps.items():
     title = " = " + cmap_category + " = "
-    print(str((len(title) + 1) * "=").center(size))
-    print(title.center(size))
-    print(str((len(title) + 1) * "=").center(size))
-    print("\n")
+    bar = ((len(title) + 1) * "=").center(size)
+    sys.stdout.write(bar + "\n" + title.center(size) + "\n" + bar + "\n\n\n")
     for cmap in cmap_list:
       PrintColorbar(cmap)
 
@@ -494,7 +683,7 @@ def GetDecoString(message):
   Decorative string, mainly for search functions.
   """
   message = " = " + message + " = "
-  size = os.get_terminal_size().columns
+  size = _get_term().columns
 
   line = str((len(message) + 1) * "=").center(size)
 
@@ -516,10 +705,27 @@ def GetNearNameColors(target, colors, least_score=0.5):
     dict[str, str]: the result
   """
 
+  # rapidfuzz runs the whole scan in C when it is installed;
+  # otherwise fall back to difflib below.
+  if _rf_process is not None:
+    hits = _rf_process.extract(
+      target,
+      list(colors.keys()),
+      scorer=_rf_fuzz.ratio,
+      score_cutoff=least_score * 100.0,
+      limit=None,
+    )
+    return {name: colors[name] for name, score, idx in hits}
+
+  # One matcher for the whole scan: seq2 (the target) is fixed, so its
+  # junk/occurrence tables are computed once instead of per candidate.
+  matcher = difflib.SequenceMatcher(None)
+  matcher.set_seq2(target)
+
   near_name_colors = {}
   for name, color in colors.items():
-    diff = difflib.SequenceMatcher(None, target, name).ratio()
-    if diff > least_score:
+    matcher.set_seq1(name)
+    if matcher.ratio() > least_score:
       near_name_colors[name] = color
 
   return near_name_colors
@@ -528,13 +734,39 @@ def GetNearNameColors(target, colors, least_score=0.5):
 # End GetNearNameColors
 
 
-def SearchColors(target, colors=mcolors.CSS4_COLORS):
+# Sorted name tuples for the static palettes, built on first search.
+# A contiguous tuple scans faster than dict.items() and is reused
+# across repeated searches in one process.
+_NAME_INDEX = {}
+
+
+def _palette_names(colors):
+  """Sorted name tuple for a palette; cached for the static tables."""
+  cacheable = colors is mcolors.CSS4_COLORS or colors is _XKCD_FILTERED
+  if cacheable and id(colors) in _NAME_INDEX:
+    return _NAME_INDEX[id(colors)]
+  names = tuple(sorted(colors))
+  if cacheable:
+    _NAME_INDEX[id(colors)] = names
+  return names
+
+
+# End _palette_names
+
+
+def SearchColors(target, colors=None):
   """
   Search mpl colors for target.
   """
-  match_colors = {
-    name: color for name, color in colors.items() if target in name
-  }
+  _import_mpl()
+  if colors is None:
+    colors = mcolors.CSS4_COLORS
+
+  # substring scan over the cached sorted index. A bisect prefix walk
+  # alone would lose hits like "darkred" for "red", so the linear pass
+  # stays; it's over a flat tuple rather than the dict.
+  names = _palette_names(colors)
+  match_colors = {name: colors[name] for name in names if target in name}
 
   message = f"RESULT (target = {target})"
   print(GetDecoString(message))
@@ -557,6 +789,30 @@ def SearchColors(target, colors=mcolors.CSS4_COLORS):
 # === Conversion Routines ===
 
 
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+def _hex_to_rgb_fast(hexval):
+  """
+  Parse "#rrggbb" (or "#rgb") directly, skipping matplotlib's regex
+  based parser. Raises ValueError for anything it can't handle.
+  """
+  h = hexval.lstrip("#")
+  if len(h) == 3:  # short form, e.g. #fa0
+    h = h[0] * 2 + h[1] * 2 + h[2] * 2
+  # int() tolerates stray whitespace, so check the digits explicitly
+  if len(h) != 6 or not _HEX_DIGITS.issuperset(h):
+    raise ValueError(f"Invalid hex color: {hexval!r}")
+  return (
+    int(h[0:2], 16) / 255.0,
+    int(h[2:4], 16) / 255.0,
+    int(h[4:6], 16) / 255.0,
+  )
+
+
+# End _hex_to_rgb_fast
+
+
 def HexToRGB(hexval):  # Unused Currently.
   """
   Convert Hex to RGB.
@@ -565,7 +821,12 @@ def HexToRGB(hexval):  # Unused Currently.
   """
   if hexval[0] != "#":
     hexval = "#" + hexval
-  return mpl.colors.to_rgb(hexval)
+  try:
+    return _hex_to_rgb_fast(hexval)
+  except ValueError:
+    # anything fancier (alpha channels, odd lengths) goes the slow way
+    _import_mpl()
+    return mpl.colors.to_rgb(hexval)
 
 
 # End HexToRGB
@@ -577,6 +838,7 @@ def RGBToHex(rgb):
   Parameter: rgb : tuple
   returns hex: string, inclding "#"
   """
+  _import_mpl()
   return mpl.colors.to_hex(rgb)
 
 
@@ -589,6 +851,7 @@ def HSVToRGB(hsv):
   Parameter: hsv : tuple
   returns rgb: tuple(r,g,b)
   """
+  _import_mpl()
   return mpl.colors.hsv_to_rgb(hsv)
 
 
@@ -601,6 +864,7 @@ def RGBToHSV(rgb):
   Parameter: rgb : tuple
   returns hsv: tuple(h,s,v)
   """
+  _import_mpl()
   return mpl.colors.rgb_to_hsv(rgb)
 
 
@@ -626,13 +890,136 @@ def HSVToHex(hsv):
   Parameter: hsv : tuple
   returns hex: string
   """
-  rgb = HSVToRGB(hsv)
+  rgb = _hsv_to_rgb_scalar(hsv[0], hsv[1], hsv[2])
   return RGBToHex(rgb)
 
 
 # End HSVToHex
 
 
+# The colormaps shown by -b, grouped the way the matplotlib docs do.
+# A plain dict keeps insertion order; tuples since nothing mutates it.
+_CMAPS = {
+  "Perceptually Uniform Sequential": (
+    "viridis",
+    "plasma",
+    "inferno",
+    "magma",
+    "cividis",
+  ),
+  "Sequential": (
+    "Greys",
+    "Purples",
+    "Blues",
+    "Greens",
+    "Oranges",
+    "Reds",
+    "YlOrBr",
+    "YlOrRd",
+    "OrRd",
+    "PuRd",
+    "RdPu",
+    "BuPu",
+    "GnBu",
+    "PuBu",
+    "YlGnBu",
+    "PuBuGn",
+    "BuGn",
+    "YlGn",
+  ),
+  "Sequential2": (
+    "binary",
+    "gist_yarg",
+    "gist_gray",
+    "gray",
+    "bone",
+    "pink",
+    "spring",
+    "summer",
+    "autumn",
+    "winter",
+    "cool",
+    "Wistia",
+    "hot",
+    "afmhot",
+    "gist_heat",
+    "copper",
+  ),
+  "Diverging": (
+    "PiYG",
+    "PRGn",
+    "BrBG",
+    "PuOr",
+    "RdGy",
+    "RdBu",
+    "RdYlBu",
+    "RdYlGn",
+    "Spectral",
+    "coolwarm",
+    "bwr",
+    "seismic",
+  ),
+  "Cyclic": ("twilight", "twilight_shifted", "hsv"),
+  "Qualitative": (
+    "Pastel1",
+    "Pastel2",
+    "Paired",
+    "Accent",
+    "Dark2",
+    "Set1",
+    "Set2",
+    "Set3",
+    "tab10",
+    "tab20",
+    "tab20b",
+    "tab20c",
+  ),
+  "Miscellaneous": (
+    "flag",
+    "prism",
+    "ocean",
+    "gist_earth",
+    "terrain",
+    "gist_stern",
+    "gnuplot",
+    "gnuplot2",
+    "CMRmap",
+    "cubehelix",
+    "brg",
+    "gist_rainbow",
+    "rainbow",
+    "jet",
+    "turbo",
+    "nipy_spectral",
+    "gist_ncar",
+  ),
+}
+
+
+_XKCD_FILTERED = None
+
+
+def _xkcd_colors():
+  """
+  The XKCD palette minus "xkcd:blue with a hint of purple", which is
+  (almost) the same as "xkcd:blurple" and that name is too damn long.
+  A filtered copy built once, so the matplotlib-owned dict is never
+  mutated.
+  """
+  global _XKCD_FILTERED
+  if _XKCD_FILTERED is None:
+    _import_mpl()
+    _XKCD_FILTERED = {
+      k: v
+      for k, v in mcolors.XKCD_COLORS.items()
+      if k != "xkcd:blue with a hint of purple"
+    }
+  return _XKCD_FILTERED
+
+
+# End _xkcd_colors
+
+
 def main(args):
   """main function. parse args and call appropriate functions"""
 
@@ -640,14 +1027,10 @@ def main(args):
     print(f"mplcolors {__version__}\n")
     return os.EX_OK
 
-  if args.colorbars is False and args.search:
-    colors = mcolors.CSS4_COLORS
-    if args.all:
-      colors = mcolors.XKCD_COLORS
-      # Remove "xkcd:blue with a hint of purple" because it is (almost)
-      # the same as "xkcd:blurple" and that name is too damn long.
-      colors.pop("xkcd:blue with a hint of purple")
+  _import_mpl()
 
+  if args.colorbars is False and args.search:
+    colors = _xkcd_colors() if args.all else mcolors.CSS4_COLORS
     SearchColors(args.search, colors=colors)
 
   elif (
@@ -659,11 +1042,7 @@ def main(args):
   ):
     PrintColors()
   elif args.colorbars is False and args.all is True:
-    color_dict = mcolors.XKCD_COLORS
-    # Remove "xkcd:blue with a hint of purple" because it is (almost)
-    # the same as "xkcd:blurple" and that name is too damn long.
-    color_dict.pop("xkcd:blue with a hint of purple")
-    PrintColors(colors=color_dict)
+    PrintColors(colors=_xkcd_colors())
   elif args.complement is not None:
     name = args.complement
     PrintComplement(name)
@@ -674,111 +1053,7 @@ def main(args):
     name = args.tetrad
     PrintTetrad(name)
   else:
-    cmaps = OrderedDict()
-
-    # Help us organize the colormaps
-
-    cmaps["Perceptually Uniform Sequential"] = [
-      "viridis",
-      "plasma",
-      "inferno",
-      "magma",
-      "cividis",
-    ]
-
-    cmaps["Sequential"] = [
-      "Greys",
-      "Purples",
-      "Blues",
-      "Greens",
-      "Oranges",
-      "Reds",
-      "YlOrBr",
-      "YlOrRd",
-      "OrRd",
-      "PuRd",
-      "RdPu",
-      "BuPu",
-      "GnBu",
-      "PuBu",
-      "YlGnBu",
-      "PuBuGn",
-      "BuGn",
-      "YlGn",
-    ]
-
-    cmaps["Sequential2"] = [
-      "binary",
-      "gist_yarg",
-      "gist_gray",
-      "gray",
-      "bone",
-      "pink",
-      "spring",
-      "summer",
-      "autumn",
-      "winter",
-      "cool",
-      "Wistia",
-      "hot",
-      "afmhot",
-      "gist_heat",
-      "copper",
-    ]
-
-    cmaps["Diverging"] = [
-      "PiYG",
-      "PRGn",
-      "BrBG",
-      "PuOr",
-      "RdGy",
-      "RdBu",
-      "RdYlBu",
-      "RdYlGn",
-      "Spectral",
-      "coolwarm",
-      "bwr",
-      "seismic",
-    ]
-
-    cmaps["Cyclic"] = ["twilight", "twilight_shifted", "hsv"]
-
-    cmaps["Qualitative"] = [
-      "Pastel1",
-      "Pastel2",
-      "Paired",
-      "Accent",
-      "Dark2",
-      "Set1",
-      "Set2",
-      "Set3",
-      "tab10",
-      "tab20",
-      "tab20b",
-      "tab20c",
-    ]
-
-    cmaps["Miscellaneous"] = [
-      "flag",
-      "prism",
-      "ocean",
-      "gist_earth",
-      "terrain",
-      "gist_stern",
-      "gnuplot",
-      "gnuplot2",
-      "CMRmap",
-      "cubehelix",
-      "brg",
-      "gist_rainbow",
-      "rainbow",
-      "jet",
-      "turbo",
-      "nipy_spectral",
-      "gist_ncar",
-    ]
-
-    PrintColorbars(cmaps)
+    PrintColorbars(_CMAPS)
   return os.EX_OK
 
 
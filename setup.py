@@ -22,5 +22,5 @@ setup(
     ],
     keywords="simulations science computing githubapp visualization cli",
     packages=find_packages(),
-    install_requires=["matplotlib", "argparse"],
+    install_requires=["matplotlib"],
 )